@@ -0,0 +1,103 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Validation helpers shared by the sync, async and write-only clients.
+# Living in one module keeps a single set of code objects in memory and
+# makes every call a module-global lookup rather than a descriptor
+# access through a class.
+
+import functools
+import re
+import uuid
+
+from urllib.parse import urlparse
+
+# Name length limits, keyed by field; names not listed here fall back to
+# _DEFAULT_FIELD_LIMIT. Precomputed once so each call is a dict lookup
+# and a single compare instead of a chain of membership tests.
+_FIELD_LIMITS = {
+    'namespace_name': 64,
+    'owner_name': 64,
+    'source_name': 64,
+}
+_DEFAULT_FIELD_LIMIT = 255
+
+
+def _is_none(variable_value, variable_name):
+    if not variable_value:
+        raise ValueError(f"{variable_name} must not be None")
+
+
+@functools.lru_cache(maxsize=64)
+def _field_errors(variable_name, limit):
+    # The error strings are constant per field, so build them once
+    # instead of assembling f-strings on every validation.
+    return (f"{variable_name} must not be None",
+            f"{variable_name} length must be <= {limit}")
+
+
+def _check_name_length(variable_value, variable_name, _len=len):
+    limit = _FIELD_LIMITS.get(variable_name, _DEFAULT_FIELD_LIMIT)
+    none_error, length_error = _field_errors(variable_name, limit)
+
+    if not variable_value:
+        raise ValueError(none_error)
+
+    if _len(variable_value) > limit:
+        raise ValueError(length_error)
+
+
+# Canonical 8-4-4-4-12 form; run ids are usually freshly generated
+# uuid4 strings, which this matches without a full uuid.UUID parse.
+_UUID_MATCH = re.compile(
+    r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-'
+    r'[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$').match
+
+
+def _is_valid_uuid(variable_value, variable_name):
+    _is_none(variable_value, variable_name)
+
+    # An actual uuid.UUID is valid by construction; no round-trip
+    # through str and back needed.
+    if isinstance(variable_value, uuid.UUID):
+        return
+
+    if isinstance(variable_value, str):
+        if _UUID_MATCH(variable_value):
+            return
+    else:
+        variable_value = str(variable_value)
+
+    try:
+        uuid.UUID(variable_value)
+    except ValueError:
+        raise ValueError(f"{variable_name} must be a valid UUID")
+
+
+def _is_instance_of(variable_value, variable_enum_type):
+    if not isinstance(variable_value, variable_enum_type):
+        raise ValueError(f"{variable_value} must be an instance"
+                         f" of {variable_enum_type}")
+
+
+@functools.lru_cache(maxsize=256)
+def _validate_connection_url(connection_url):
+    # A source is typically registered with the same connection url
+    # over and over; cache the parse so repeats are a dict lookup.
+    if not urlparse(connection_url).scheme:
+        raise ValueError(
+            f"connection_url must have a scheme: '{connection_url}'")
+
+
+def _is_valid_connection_url(connection_url):
+    _is_none(connection_url, 'connection_url')
+    _validate_connection_url(connection_url)
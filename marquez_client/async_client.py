@@ -0,0 +1,407 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+import aiohttp
+
+from .models import DatasetType, SourceType, JobType
+from marquez_client import errors
+from marquez_client import log
+from marquez_client._validators import (
+    _check_name_length, _is_instance_of, _is_none,
+    _is_valid_connection_url, _is_valid_uuid
+)
+from marquez_client.client import (
+    _API_PATH, _HEADERS, _quote_arg,
+    _PATH_NAMESPACES, _PATH_NAMESPACE, _PATH_SOURCES, _PATH_SOURCE,
+    _PATH_DATASETS, _PATH_DATASET, _PATH_DATASET_TAG,
+    _PATH_DATASET_FIELD_TAG, _PATH_JOBS, _PATH_JOB, _PATH_JOB_RUNS,
+    _PATH_JOB_RUN, _PATH_TAGS, _RUN_TRANSITION_PATHS
+)
+from marquez_client.constants import (
+    ENABLE_SSL, DEFAULT_HOST, DEFAULT_PORT, DEFAULT_TIMEOUT_MS
+)
+
+
+# Async Marquez Client
+class AsyncMarquezClient(object):
+    """Asyncio variant of MarquezClient backed by aiohttp.
+
+    Exposes the same method surface as MarquezClient, with each call
+    awaitable so independent calls can be gathered concurrently:
+
+        async with AsyncMarquezClient() as client:
+            await asyncio.gather(
+                client.create_namespace('my-namespace', 'me'),
+                client.create_source('my-source', SourceType.POSTGRESQL,
+                                     connection_url)
+            )
+    """
+    def __init__(self, enable_ssl=False, host=None, port=None,
+                 timeout_ms=None):
+        enable_ssl = enable_ssl or os.environ.get('ENABLE_SSL', ENABLE_SSL)
+        host = host or os.environ.get('MARQUEZ_HOST', DEFAULT_HOST)
+        port = port or os.environ.get('MARQUEZ_PORT', DEFAULT_PORT)
+        self._timeout = float(timeout_ms or os.environ.get(
+            'MARQUEZ_TIMEOUT_MS', DEFAULT_TIMEOUT_MS)
+        ) / 1000.0
+
+        protocol = 'http'
+        if enable_ssl:
+            protocol = 'https'
+
+        self._api_base = f'{protocol}://{host}:{port}/{_API_PATH}'
+
+        if not port or port == 80:
+            self._api_base = f'{protocol}://{host}/{_API_PATH}'
+
+        # The session is created lazily so that the client can be
+        # constructed outside of a running event loop.
+        self._session = None
+
+        log.debug(self._api_base)
+
+    def _session_or_new(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=50,
+                    limit_per_host=20,
+                    keepalive_timeout=30
+                )
+            )
+        return self._session
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    # Namespace API
+    async def create_namespace(self, namespace_name, owner_name,
+                               description=None):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(owner_name, 'owner_name')
+
+        payload = {
+            'ownerName': owner_name
+        }
+
+        if description:
+            payload['description'] = description
+
+        return await self._put(
+            self._url(_PATH_NAMESPACE, namespace_name),
+            payload=payload
+        )
+
+    async def get_namespace(self, namespace_name):
+        _check_name_length(namespace_name, 'namespace_name')
+
+        return await self._get(self._url(_PATH_NAMESPACE, namespace_name))
+
+    async def list_namespaces(self, limit=None, offset=None):
+        return await self._get(
+            self._url(_PATH_NAMESPACES),
+            params={
+                'limit': limit,
+                'offset': offset
+            }
+        )
+
+    # Source API
+    async def create_source(self, source_name, source_type, connection_url,
+                            description=None):
+        _check_name_length(source_name, 'source_name')
+        _is_instance_of(source_type, SourceType)
+
+        _is_valid_connection_url(connection_url)
+
+        payload = {
+            'type': source_type.value,
+            'connectionUrl': connection_url
+        }
+
+        if description:
+            payload['description'] = description
+
+        return await self._put(self._url(_PATH_SOURCE, source_name),
+                               payload=payload)
+
+    async def get_source(self, source_name):
+        _check_name_length(source_name, 'source_name')
+
+        return await self._get(self._url(_PATH_SOURCE, source_name))
+
+    async def list_sources(self, limit=None, offset=None):
+        return await self._get(
+            self._url(_PATH_SOURCES),
+            params={
+                'limit': limit,
+                'offset': offset
+            }
+        )
+
+    # Datasets API
+    async def create_dataset(self, namespace_name, dataset_name, dataset_type,
+                             physical_name, source_name,
+                             description=None, run_id=None,
+                             schema_location=None,
+                             fields=None, tags=None):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(dataset_name, 'dataset_name')
+        _is_instance_of(dataset_type, DatasetType)
+
+        if dataset_type == DatasetType.STREAM:
+            _is_none(schema_location, 'schema_location')
+
+        _check_name_length(physical_name, 'physical_name')
+        _check_name_length(source_name, 'source_name')
+
+        payload = {
+            'type': dataset_type.value,
+            'physicalName': physical_name,
+            'sourceName': source_name,
+        }
+
+        if description:
+            payload['description'] = description
+
+        if run_id:
+            payload['runId'] = run_id
+
+        if fields:
+            payload['fields'] = fields
+
+        if tags:
+            payload['tags'] = tags
+
+        if schema_location:
+            payload['schemaLocation'] = schema_location
+
+        return await self._put(
+            self._url(_PATH_DATASET, namespace_name,
+                      dataset_name),
+            payload=payload
+        )
+
+    async def get_dataset(self, namespace_name, dataset_name):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(dataset_name, 'dataset_name')
+
+        return await self._get(
+            self._url(_PATH_DATASET,
+                      namespace_name, dataset_name)
+        )
+
+    async def list_datasets(self, namespace_name, limit=None, offset=None):
+        _check_name_length(namespace_name, 'namespace_name')
+
+        return await self._get(
+            self._url(_PATH_DATASETS, namespace_name),
+            params={
+                'limit': limit,
+                'offset': offset
+            }
+        )
+
+    async def tag_dataset(self, namespace_name, dataset_name, tag_name):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(dataset_name, 'dataset_name')
+
+        if not tag_name:
+            raise ValueError('tag_name must not be None')
+
+        return await self._post(
+            self._url(_PATH_DATASET_TAG,
+                      namespace_name, dataset_name, tag_name)
+        )
+
+    async def tag_dataset_field(self, namespace_name, dataset_name,
+                                field_name, tag_name):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(dataset_name, 'dataset_name')
+        _check_name_length(field_name, 'field_name')
+        _check_name_length(tag_name, 'tag_name')
+
+        return await self._post(
+            self._url(_PATH_DATASET_FIELD_TAG,
+                      namespace_name, dataset_name, field_name, tag_name)
+        )
+
+    # Job API
+    async def create_job(self, namespace_name, job_name, job_type,
+                         location=None, input_dataset=None,
+                         output_dataset=None, description=None, context=None):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(job_name, 'job_name')
+        _is_instance_of(job_type, JobType)
+
+        payload = {
+            'inputs': input_dataset or [],
+            'outputs': output_dataset or [],
+            'type': job_type.name
+        }
+
+        if context:
+            payload['context'] = context
+
+        if location:
+            payload['location'] = location
+
+        if description:
+            payload['description'] = description
+
+        return await self._put(
+            self._url(_PATH_JOB, namespace_name, job_name),
+            payload=payload
+        )
+
+    async def get_job(self, namespace_name, job_name):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(job_name, 'job_name')
+
+        return await self._get(
+            self._url(_PATH_JOB, namespace_name, job_name)
+        )
+
+    async def list_jobs(self, namespace_name, limit=None, offset=None):
+        _check_name_length(namespace_name, 'namespace_name')
+
+        return await self._get(
+            self._url(_PATH_JOBS, namespace_name),
+            params={
+                'limit': limit,
+                'offset': offset
+            }
+        )
+
+    async def create_job_run(self, namespace_name, job_name,
+                             nominal_start_time=None,
+                             nominal_end_time=None, run_args=None,
+                             mark_as_running=False):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(job_name, 'job_name')
+
+        payload = {}
+
+        if nominal_start_time:
+            payload['nominalStartTime'] = nominal_start_time
+
+        if nominal_end_time:
+            payload['nominalEndTime'] = nominal_end_time
+
+        if run_args:
+            payload['runArgs'] = run_args
+
+        response = await self._post(
+            self._url(_PATH_JOB_RUNS,
+                      namespace_name, job_name),
+            payload=payload)
+
+        if mark_as_running:
+            run_id = response['runId']
+            response = await self.mark_job_run_as_started(run_id)
+
+        return response
+
+    async def list_job_runs(self, namespace_name, job_name, limit=None,
+                            offset=None):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(job_name, 'job_name')
+
+        return await self._get(
+            self._url(
+                _PATH_JOB_RUNS,
+                namespace_name,
+                job_name),
+            params={
+                'limit': limit,
+                'offset': offset
+            }
+        )
+
+    async def get_job_run(self, run_id):
+        _is_valid_uuid(run_id, 'run_id')
+
+        return await self._get(self._url(_PATH_JOB_RUN, run_id))
+
+    async def mark_job_run_as_started(self, run_id):
+        return await self.__mark_job_run_as(run_id, 'start')
+
+    async def mark_job_run_as_completed(self, run_id):
+        return await self.__mark_job_run_as(run_id, 'complete')
+
+    async def mark_job_run_as_failed(self, run_id):
+        return await self.__mark_job_run_as(run_id, 'fail')
+
+    async def mark_job_run_as_aborted(self, run_id):
+        return await self.__mark_job_run_as(run_id, 'abort')
+
+    async def list_tags(self, limit=None, offset=None):
+        return await self._get(
+            self._url(_PATH_TAGS),
+            params={
+                'limit': limit,
+                'offset': offset
+            }
+        )
+
+    async def __mark_job_run_as(self, run_id, action):
+        _is_valid_uuid(run_id, 'run_id')
+
+        return await self._post(
+            self._url(_RUN_TRANSITION_PATHS[action], run_id), payload={}
+        )
+
+    # Common
+    def _url(self, path, *args):
+        # _quote_arg is lru_cache'd, so the repeated names of a DAG run
+        # skip the encode+quote after their first use entirely; the %s
+        # templates skip str.format's mini-language parse.
+        return f'{self._api_base}{path % tuple(map(_quote_arg, args))}'
+
+    async def _post(self, url, payload=None):
+        return await self._request('POST', url, payload=payload)
+
+    async def _put(self, url, payload=None):
+        return await self._request('PUT', url, payload=payload)
+
+    async def _get(self, url, params=None):
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        return await self._request('GET', url, params=params)
+
+    async def _request(self, method, url, payload=None, params=None):
+        session = self._session_or_new()
+
+        async with session.request(
+                method, url, json=payload, params=params) as response:
+            log.info(f'{url}', method=method)
+
+            try:
+                response.raise_for_status()
+            except aiohttp.ClientResponseError as e:
+                self._raise_api_error(e)
+
+            return await response.json()
+
+    def _raise_api_error(self, e):
+        # TODO: https://github.com/MarquezProject/marquez-python/issues/55
+        raise errors.APIError() from e
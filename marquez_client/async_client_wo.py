@@ -0,0 +1,73 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from marquez_client._validators import _check_name_length
+from marquez_client.client_wo import MarquezWriteOnlyClient
+
+
+# Async Marquez Write Only Client
+class AsyncMarquezWriteOnlyClient(MarquezWriteOnlyClient):
+    """MarquezWriteOnlyClient paired with an async backend such as
+    AsyncHttpBackend.
+
+    The inherited methods validate synchronously and return the
+    backend's awaitable, so independent emissions can be gathered:
+
+        async with AsyncMarquezWriteOnlyClient(backend) as client:
+            await asyncio.gather(
+                client.create_namespace('my-namespace', 'me'),
+                client.create_source('my-source', SourceType.POSTGRESQL,
+                                     connection_url)
+            )
+
+    Only create_job_run and submit_run are overridden: their follow-up
+    calls depend on the first completing, so both must be awaited in
+    order.
+    """
+
+    async def create_job_run(self, namespace_name, job_name, run_id,
+                             nominal_start_time=None, nominal_end_time=None,
+                             run_args=None, mark_as_running=False):
+        response = await super().create_job_run(
+            namespace_name, job_name, run_id,
+            nominal_start_time=nominal_start_time,
+            nominal_end_time=nominal_end_time,
+            run_args=run_args)
+
+        if mark_as_running:
+            response = await self.mark_job_run_as_started(run_id)
+
+        return response
+
+    async def submit_run(self, namespace_name, job_name, run_id,
+                         final_state, start_time=None, end_time=None,
+                         inputs=None, outputs=None):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(job_name, 'job_name')
+
+        job = {'namespace': namespace_name, 'name': job_name}
+
+        await self.emit_lineage(run_id, 'START', job, inputs=inputs,
+                                event_time=start_time)
+
+        return await self.emit_lineage(run_id, final_state, job,
+                                       inputs=inputs, outputs=outputs,
+                                       event_time=end_time)
+
+    async def close(self):
+        await self._backend.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
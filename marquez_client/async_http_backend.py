@@ -0,0 +1,78 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import aiohttp
+
+from marquez_client import errors
+from marquez_client import log
+from marquez_client.backend import Backend
+from marquez_client.client import (
+    _CONTENT_TYPE_JSON, _DEFAULT_TIMEOUT_S, _HEADERS,
+    _json_dumps, _json_loads
+)
+
+
+class AsyncHttpBackend(Backend):
+    """Emits metadata to a Marquez HTTP endpoint over aiohttp.
+
+    One long-lived ClientSession with a shared TCPConnector is reused
+    across calls, so independent emissions can be gathered concurrently
+    while still pooling connections to the same host.
+    """
+
+    def __init__(self, url, timeout_ms=None):
+        self._url = url
+        self._timeout = (float(timeout_ms) / 1000.0 if timeout_ms
+                         else _DEFAULT_TIMEOUT_S)
+
+        # Created lazily so the backend can be constructed outside of a
+        # running event loop.
+        self._session = None
+
+        log.debug(self._url)
+
+    def _session_or_new(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={**_HEADERS, **_CONTENT_TYPE_JSON},
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    keepalive_timeout=30
+                )
+            )
+        return self._session
+
+    async def put(self, path, headers, payload):
+        return await self._request('PUT', path, headers, payload)
+
+    async def post(self, path, headers, payload=None):
+        return await self._request('POST', path, headers, payload)
+
+    async def _request(self, method, path, headers, payload):
+        session = self._session_or_new()
+
+        async with session.request(
+                method, f'{self._url}{path}',
+                headers=None if headers is _HEADERS else headers,
+                data=_json_dumps(payload) if payload is not None
+                else None) as response:
+            try:
+                response.raise_for_status()
+            except aiohttp.ClientResponseError as e:
+                raise errors.APIError() from e
+
+            return _json_loads(await response.read())
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
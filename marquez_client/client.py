@@ -10,110 +10,315 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
+import functools
+import gzip
 import json
+import logging
 import os
-import requests
+import re
+import sys
 import time
-import uuid
+
+# requests (and its urllib3 vendor tree) costs tens of milliseconds to
+# import; defer it so `import marquez_client` stays cheap for callers
+# that never issue a request. The network helpers import it on demand,
+# which after the first call is just a sys.modules lookup.
 
 from .models import DatasetType, SourceType, JobType
 from marquez_client import errors
 from marquez_client import log
+from marquez_client._validators import (
+    _check_name_length, _is_instance_of, _is_none,
+    _is_valid_connection_url, _is_valid_uuid
+)
 from marquez_client.constants import (
     ENABLE_SSL, DEFAULT_HOST, DEFAULT_PORT, DEFAULT_TIMEOUT_MS
 )
 from marquez_client.version import VERSION
-from six.moves.urllib.parse import quote
+from urllib.parse import quote_from_bytes, urlencode
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 _API_PATH = 'api/v1'
-_USER_AGENT = f'marquez-python/{VERSION}'
+_USER_AGENT = sys.intern(f'marquez-python/{VERSION}')
 _HEADERS = {'User-Agent': _USER_AGENT}
 
+# Environment-derived defaults, snapshotted once at import so client
+# construction does not re-read os.environ per instance.
+_ENV_ENABLE_SSL = os.environ.get('ENABLE_SSL', ENABLE_SSL)
+_ENV_HOST = os.environ.get('MARQUEZ_HOST', DEFAULT_HOST)
+_ENV_PORT = os.environ.get('MARQUEZ_PORT', DEFAULT_PORT)
+_DEFAULT_TIMEOUT_S = float(
+    os.environ.get('MARQUEZ_TIMEOUT_MS', DEFAULT_TIMEOUT_MS)) / 1000.0
+_JSON_HEADERS = {**_HEADERS, 'Content-Type': 'application/json'}
+
+_BACKENDS = ('requests', 'urllib3')
+
+# Enum member -> wire value, precomputed; payload construction then does
+# a plain dict lookup instead of a descriptor access per call.
+_SOURCE_TYPE_VALUES = {m: m.value for m in SourceType}
+_DATASET_TYPE_VALUES = {m: m.value for m in DatasetType}
+_JOB_TYPE_NAMES = {m: m.name for m in JobType}
+
+_CONTENT_TYPE_JSON = {'Content-Type': 'application/json'}
+_CONTENT_TYPE_JSON_GZIP = {**_CONTENT_TYPE_JSON, 'Content-Encoding': 'gzip'}
+_JSON_HEADERS_GZIP = {**_JSON_HEADERS, 'Content-Encoding': 'gzip'}
+
+# Bodies below this size are not worth the compression round-trip.
+_COMPRESS_MIN_BYTES = 1024
+
+# orjson is an optional C extension that is ~3-5x faster than stdlib
+# json on both encode and decode; fall back to stdlib when not present.
+if orjson is not None:
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+
+    def _json_loads(data):
+        return orjson.loads(data)
+else:
+    def _json_dumps(obj):
+        # default=str covers uuid.UUID run ids, which orjson
+        # serializes natively.
+        return json.dumps(obj, default=str).encode('utf-8')
+
+    def _json_loads(data):
+        return json.loads(data)
+
+# Path templates, hoisted to module level; %-substitution skips the
+# str.format mini-language parse on every call.
+_PATH_NAMESPACES = '/namespaces'
+_PATH_NAMESPACE = '/namespaces/%s'
+_PATH_SOURCES = '/sources'
+_PATH_SOURCE = '/sources/%s'
+_PATH_DATASETS = '/namespaces/%s/datasets'
+_PATH_DATASET = '/namespaces/%s/datasets/%s'
+_PATH_DATASET_TAG = '/namespaces/%s/datasets/%s/tags/%s'
+_PATH_DATASET_FIELD_TAG = '/namespaces/%s/datasets/%s/fields/%s/tags/%s'
+_PATH_JOBS = '/namespaces/%s/jobs'
+_PATH_JOB = '/namespaces/%s/jobs/%s'
+_PATH_JOB_RUNS = '/namespaces/%s/jobs/%s/runs'
+_PATH_JOB_RUN = '/jobs/runs/%s'
+_PATH_TAGS = '/tags'
+
+# Run state transitions map to a fixed set of path templates, so format
+# the action suffix in once instead of on every call.
+_RUN_TRANSITION_PATHS = {
+    action: f'/jobs/runs/%s/{action}'
+    for action in ('start', 'complete', 'fail', 'abort')
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _build_api_base(protocol, host, port):
+    if not port or port == 80:
+        return f'{protocol}://{host}/{_API_PATH}'
+    return f'{protocol}://{host}:{port}/{_API_PATH}'
+
+
+# Unreserved characters per RFC 3986; quote() would return such
+# strings unchanged, so detect them up front and skip it.
+_URL_SAFE_MATCH = re.compile(r'^[A-Za-z0-9._~\-]+$').match
+
+
+@functools.lru_cache(maxsize=4096)
+def _quote_arg(arg):
+    # Run ids may arrive as uuid.UUID now that the validators accept
+    # them; their canonical form is hex-and-dashes, i.e. URL-safe.
+    if not isinstance(arg, str):
+        return str(arg)
+
+    # Names repeat and hit the cache, but freshly generated run ids
+    # miss it every time; being hex-and-dashes they take the URL-safe
+    # fast path and never pay for the encode+quote.
+    if _URL_SAFE_MATCH(arg):
+        return arg
+
+    # quote_from_bytes skips the type-check/encode shim quote() adds
+    return quote_from_bytes(arg.encode('utf-8'), safe=b'')
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_url(api_base, path, args):
+    return f'{api_base}{path % tuple(_quote_arg(arg) for arg in args)}'
+
+
+def _make_mark_job_run_as(action):
+    # Specialize one method per run state transition, with the
+    # action-suffixed path template prefolded into the closure.
+    path = _RUN_TRANSITION_PATHS[action]
+
+    def mark_job_run_as(self, run_id):
+        _is_valid_uuid(run_id, 'run_id')
+
+        return self._post(self._url(path, run_id), payload={})
+
+    mark_job_run_as.__name__ = f'mark_job_run_as_{action}'
+    return mark_job_run_as
+
 
 # Marquez Client
 class MarquezClient(object):
+    # The attribute set is small and fixed; slots drop the per-instance
+    # __dict__ and make the hot-path self._session/self._timeout loads
+    # C-level slot reads.
+    __slots__ = ('_timeout', '_api_base', '_session', '_pool', '_pending',
+                 '_compress')
+
     def __init__(self, enable_ssl=False, host=None, port=None,
-                 timeout_ms=None):
-        enable_ssl = enable_ssl or os.environ.get('ENABLE_SSL', ENABLE_SSL)
-        host = host or os.environ.get('MARQUEZ_HOST', DEFAULT_HOST)
-        port = port or os.environ.get('MARQUEZ_PORT', DEFAULT_PORT)
-        self._timeout = self._to_seconds(timeout_ms or os.environ.get(
-            'MARQUEZ_TIMEOUT_MS', DEFAULT_TIMEOUT_MS)
-        )
+                 timeout_ms=None, backend='requests', compress=True):
+        if backend not in _BACKENDS:
+            raise ValueError(f"backend must be one of {_BACKENDS}")
+
+        enable_ssl = enable_ssl or _ENV_ENABLE_SSL
+        host = host or _ENV_HOST
+        port = port or _ENV_PORT
+        self._timeout = (float(timeout_ms) / 1000.0 if timeout_ms
+                         else _DEFAULT_TIMEOUT_S)
 
         protocol = 'http'
         if enable_ssl:
             protocol = 'https'
 
-        self._api_base = f'{protocol}://{host}:{port}/{_API_PATH}'
+        # Interned so per-task clients fanned out across workers (e.g.
+        # pickled into Airflow tasks) share one copy and compare by
+        # pointer in dict lookups.
+        self._api_base = sys.intern(_build_api_base(protocol, host, port))
+
+        # The 'urllib3' backend skips the per-call request preparation
+        # (hooks, cookies, adapter dispatch) that requests layers on top
+        # of the pool; the default remains 'requests'.
+        if backend == 'urllib3':
+            import urllib3
+
+            self._session = None
+            self._pool = urllib3.PoolManager(
+                num_pools=1, maxsize=20, headers=_HEADERS,
+                timeout=self._timeout)
+        else:
+            self._session = self._new_session()
+            self._pool = None
+        self._pending = []
 
-        if not port or port == 80:
-            self._api_base = f'{protocol}://{host}/{_API_PATH}'
+        # Marquez (Dropwizard) accepts gzip request bodies; pass
+        # compress=False for proxies that mishandle encoded requests.
+        self._compress = compress
 
         log.debug(self._api_base)
 
+    @classmethod
+    def from_config(cls, config):
+        """Builds a client from a config dict, e.g.:
+
+            MarquezClient.from_config({'host': 'localhost', 'port': 5000})
+        """
+        host = config.get('host')
+
+        return cls(
+            enable_ssl=config.get('enable_ssl', False),
+            host=sys.intern(host) if host else None,
+            port=config.get('port'),
+            timeout_ms=config.get('timeout_ms'),
+            backend=config.get('backend', 'requests'),
+            compress=config.get('compress', True)
+        )
+
+    @staticmethod
+    def _new_session():
+        import requests
+
+        session = requests.Session()
+        session.headers.update(_HEADERS)
+
+        # Retrying transient failures on the pooled connection avoids
+        # tearing down and re-establishing sockets from a caller-side
+        # retry loop. PUT is safe to include: the Marquez API upserts
+        # resources by name.
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=requests.adapters.Retry(
+                total=5,
+                connect=3,
+                read=3,
+                status=3,
+                backoff_factor=0.25,
+                status_forcelist=(429, 502, 503, 504),
+                respect_retry_after_header=True,
+                allowed_methods=frozenset(['GET', 'PUT', 'POST'])
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        return session
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+        if self._pool is not None:
+            self._pool.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     # Namespace API
     def create_namespace(self, namespace_name, owner_name, description=None):
-        MarquezClient._check_name_length(namespace_name, 'namespace_name')
-        MarquezClient._check_name_length(owner_name, 'owner_name')
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(owner_name, 'owner_name')
 
         payload = {
-            'ownerName': owner_name
+            'ownerName': owner_name,
+            **({'description': description} if description else {})
         }
 
-        if description:
-            payload['description'] = description
-
         return self._put(
-            self._url('/namespaces/{0}', namespace_name),
+            self._url(_PATH_NAMESPACE, namespace_name),
             payload=payload
         )
 
     def get_namespace(self, namespace_name):
-        MarquezClient._check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(namespace_name, 'namespace_name')
 
-        return self._get(self._url('/namespaces/{0}', namespace_name))
+        return self._get(self._url(_PATH_NAMESPACE, namespace_name))
 
     def list_namespaces(self, limit=None, offset=None):
         return self._get(
-            self._url('/namespaces'),
-            params={
-                'limit': limit,
-                'offset': offset
-            }
+            self._url(_PATH_NAMESPACES) + self._qs(limit=limit,
+                                                   offset=offset)
         )
 
     # Source API
     def create_source(self, source_name, source_type, connection_url,
                       description=None):
-        MarquezClient._check_name_length(source_name, 'source_name')
-        MarquezClient._is_instance_of(source_type, SourceType)
+        _check_name_length(source_name, 'source_name')
+        _is_instance_of(source_type, SourceType)
 
-        MarquezClient._is_valid_connection_url(connection_url)
+        _is_valid_connection_url(connection_url)
 
         payload = {
-            'type': source_type.value,
-            'connectionUrl': connection_url
+            'type': _SOURCE_TYPE_VALUES[source_type],
+            'connectionUrl': connection_url,
+            **({'description': description} if description else {})
         }
 
-        if description:
-            payload['description'] = description
-
-        return self._put(self._url('/sources/{0}', source_name),
+        return self._put(self._url(_PATH_SOURCE, source_name),
                          payload=payload)
 
     def get_source(self, source_name):
-        MarquezClient._check_name_length(source_name, 'source_name')
+        _check_name_length(source_name, 'source_name')
 
-        return self._get(self._url('/sources/{0}', source_name))
+        return self._get(self._url(_PATH_SOURCE, source_name))
 
     def list_sources(self, limit=None, offset=None):
         return self._get(
-            self._url('/sources'),
-            params={
-                'limit': limit,
-                'offset': offset
-            }
+            self._url(_PATH_SOURCES) + self._qs(limit=limit, offset=offset)
         )
 
     # Datasets API
@@ -122,84 +327,99 @@ class MarquezClient(object):
                        description=None, run_id=None,
                        schema_location=None,
                        fields=None, tags=None):
-        MarquezClient._check_name_length(namespace_name, 'namespace_name')
-        MarquezClient._check_name_length(dataset_name, 'dataset_name')
-        MarquezClient._is_instance_of(dataset_type, DatasetType)
-
-        if dataset_type == DatasetType.STREAM:
-            MarquezClient._is_none(schema_location, 'schema_location')
-
-        MarquezClient._check_name_length(physical_name, 'physical_name')
-        MarquezClient._check_name_length(source_name, 'source_name')
-
-        payload = {
-            'type': dataset_type.value,
-            'physicalName': physical_name,
-            'sourceName': source_name,
-        }
+        payload = self._dataset_payload(
+            namespace_name, dataset_name, dataset_type, physical_name,
+            source_name, description, run_id, schema_location, fields, tags)
 
-        if description:
-            payload['description'] = description
+        return self._put(
+            self._url(_PATH_DATASET, namespace_name,
+                      dataset_name),
+            payload=payload
+        )
 
-        if run_id:
-            payload['runId'] = run_id
+    def enqueue_dataset(self, namespace_name, dataset_name, dataset_type,
+                        physical_name, source_name,
+                        description=None, run_id=None,
+                        schema_location=None,
+                        fields=None, tags=None):
+        payload = self._dataset_payload(
+            namespace_name, dataset_name, dataset_type, physical_name,
+            source_name, description, run_id, schema_location, fields, tags)
+
+        self._pending.append(
+            ('PUT',
+             self._url(_PATH_DATASET, namespace_name,
+                       dataset_name),
+             payload)
+        )
 
-        if fields:
-            payload['fields'] = fields
+    @staticmethod
+    def _dataset_payload(namespace_name, dataset_name, dataset_type,
+                         physical_name, source_name, description, run_id,
+                         schema_location, fields, tags):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(dataset_name, 'dataset_name')
+        _is_instance_of(dataset_type, DatasetType)
 
-        if tags:
-            payload['tags'] = tags
+        if dataset_type == DatasetType.STREAM:
+            _is_none(schema_location, 'schema_location')
 
-        if schema_location:
-            payload['schemaLocation'] = schema_location
+        _check_name_length(physical_name, 'physical_name')
+        _check_name_length(source_name, 'source_name')
 
-        return self._put(
-            self._url('/namespaces/{0}/datasets/{1}', namespace_name,
-                      dataset_name),
-            payload=payload
+        optional = (
+            ('description', description),
+            ('runId', run_id),
+            ('fields', fields),
+            ('tags', tags),
+            ('schemaLocation', schema_location)
         )
 
+        return {
+            'type': _DATASET_TYPE_VALUES[dataset_type],
+            'physicalName': physical_name,
+            'sourceName': source_name,
+            **{k: v for k, v in optional if v}
+        }
+
     def get_dataset(self, namespace_name, dataset_name):
-        MarquezClient._check_name_length(namespace_name, 'namespace_name')
-        MarquezClient._check_name_length(dataset_name, 'dataset_name')
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(dataset_name, 'dataset_name')
 
         return self._get(
-            self._url('/namespaces/{0}/datasets/{1}',
+            self._url(_PATH_DATASET,
                       namespace_name, dataset_name)
         )
 
     def list_datasets(self, namespace_name, limit=None, offset=None):
-        MarquezClient._check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(namespace_name, 'namespace_name')
 
         return self._get(
-            self._url('/namespaces/{0}/datasets', namespace_name),
-            params={
-                'limit': limit,
-                'offset': offset
-            }
+            self._url(_PATH_DATASETS, namespace_name) +
+            self._qs(limit=limit, offset=offset)
         )
 
     def tag_dataset(self, namespace_name, dataset_name, tag_name):
-        MarquezClient._check_name_length(namespace_name, 'namespace_name')
-        MarquezClient._check_name_length(dataset_name, 'dataset_name')
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(dataset_name, 'dataset_name')
 
         if not tag_name:
             raise ValueError('tag_name must not be None')
 
         return self._post(
-            self._url('/namespaces/{0}/datasets/{1}/tags/{2}',
+            self._url(_PATH_DATASET_TAG,
                       namespace_name, dataset_name, tag_name)
         )
 
     def tag_dataset_field(self, namespace_name, dataset_name, field_name,
                           tag_name):
-        MarquezClient._check_name_length(namespace_name, 'namespace_name')
-        MarquezClient._check_name_length(dataset_name, 'dataset_name')
-        MarquezClient._check_name_length(field_name, 'field_name')
-        MarquezClient._check_name_length(tag_name, 'tag_name')
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(dataset_name, 'dataset_name')
+        _check_name_length(field_name, 'field_name')
+        _check_name_length(tag_name, 'tag_name')
 
         return self._post(
-            self._url('/namespaces/{0}/datasets/{1}/fields/{2}/tags/{3}',
+            self._url(_PATH_DATASET_FIELD_TAG,
                       namespace_name, dataset_name, field_name, tag_name)
         )
 
@@ -207,69 +427,81 @@ class MarquezClient(object):
     def create_job(self, namespace_name, job_name, job_type, location=None,
                    input_dataset=None,
                    output_dataset=None, description=None, context=None):
-        MarquezClient._check_name_length(namespace_name, 'namespace_name')
-        MarquezClient._check_name_length(job_name, 'job_name')
-        MarquezClient._is_instance_of(job_type, JobType)
-
-        payload = {
-            'inputs': input_dataset or [],
-            'outputs': output_dataset or [],
-            'type': job_type.name
-        }
-
-        if context:
-            payload['context'] = context
-
-        if location:
-            payload['location'] = location
-
-        if description:
-            payload['description'] = description
+        payload = self._job_payload(
+            namespace_name, job_name, job_type, location, input_dataset,
+            output_dataset, description, context)
 
         return self._put(
-            self._url('/namespaces/{0}/jobs/{1}', namespace_name, job_name),
+            self._url(_PATH_JOB, namespace_name, job_name),
             payload=payload
         )
 
+    def enqueue_job(self, namespace_name, job_name, job_type, location=None,
+                    input_dataset=None,
+                    output_dataset=None, description=None, context=None):
+        payload = self._job_payload(
+            namespace_name, job_name, job_type, location, input_dataset,
+            output_dataset, description, context)
+
+        self._pending.append(
+            ('PUT',
+             self._url(_PATH_JOB, namespace_name, job_name),
+             payload)
+        )
+
+    @staticmethod
+    def _job_payload(namespace_name, job_name, job_type, location,
+                     input_dataset, output_dataset, description, context):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(job_name, 'job_name')
+        _is_instance_of(job_type, JobType)
+
+        optional = (
+            ('context', context),
+            ('location', location),
+            ('description', description)
+        )
+
+        return {
+            'inputs': input_dataset or [],
+            'outputs': output_dataset or [],
+            'type': _JOB_TYPE_NAMES[job_type],
+            **{k: v for k, v in optional if v}
+        }
+
     def get_job(self, namespace_name, job_name):
-        MarquezClient._check_name_length(namespace_name, 'namespace_name')
-        MarquezClient._check_name_length(job_name, 'job_name')
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(job_name, 'job_name')
 
         return self._get(
-            self._url('/namespaces/{0}/jobs/{1}', namespace_name, job_name)
+            self._url(_PATH_JOB, namespace_name, job_name)
         )
 
     def list_jobs(self, namespace_name, limit=None, offset=None):
-        MarquezClient._check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(namespace_name, 'namespace_name')
 
         return self._get(
-            self._url('/namespaces/{0}/jobs', namespace_name),
-            params={
-                'limit': limit,
-                'offset': offset
-            }
+            self._url(_PATH_JOBS, namespace_name) +
+            self._qs(limit=limit, offset=offset)
         )
 
     def create_job_run(self, namespace_name, job_name,
                        nominal_start_time=None,
                        nominal_end_time=None, run_args=None,
                        mark_as_running=False):
-        MarquezClient._check_name_length(namespace_name, 'namespace_name')
-        MarquezClient._check_name_length(job_name, 'job_name')
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(job_name, 'job_name')
 
-        payload = {}
-
-        if nominal_start_time:
-            payload['nominalStartTime'] = nominal_start_time
-
-        if nominal_end_time:
-            payload['nominalEndTime'] = nominal_end_time
+        optional = (
+            ('nominalStartTime', nominal_start_time),
+            ('nominalEndTime', nominal_end_time),
+            ('runArgs', run_args)
+        )
 
-        if run_args:
-            payload['runArgs'] = run_args
+        payload = {k: v for k, v in optional if v}
 
         response = self._post(
-            self._url('/namespaces/{0}/jobs/{1}/runs',
+            self._url(_PATH_JOB_RUNS,
                       namespace_name, job_name),
             payload=payload)
 
@@ -281,143 +513,163 @@ class MarquezClient(object):
 
     def list_job_runs(self, namespace_name, job_name, limit=None,
                       offset=None):
-        MarquezClient._check_name_length(namespace_name, 'namespace_name')
-        MarquezClient._check_name_length(job_name, 'job_name')
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(job_name, 'job_name')
 
         return self._get(
             self._url(
-                '/namespaces/{0}/jobs/{1}/runs',
+                _PATH_JOB_RUNS,
                 namespace_name,
-                job_name),
-            params={
-                'limit': limit,
-                'offset': offset
-            }
+                job_name) + self._qs(limit=limit, offset=offset)
         )
 
     def get_job_run(self, run_id):
-        self._is_valid_uuid(run_id, 'run_id')
+        _is_valid_uuid(run_id, 'run_id')
 
-        return self._get(self._url('/jobs/runs/{0}', run_id))
+        return self._get(self._url(_PATH_JOB_RUN, run_id))
 
-    def mark_job_run_as_started(self, run_id):
-        return self.__mark_job_run_as(run_id, 'start')
-
-    def mark_job_run_as_completed(self, run_id):
-        return self.__mark_job_run_as(run_id, 'complete')
-
-    def mark_job_run_as_failed(self, run_id):
-        return self.__mark_job_run_as(run_id, 'fail')
-
-    def mark_job_run_as_aborted(self, run_id):
-        return self.__mark_job_run_as(run_id, 'abort')
+    mark_job_run_as_started = _make_mark_job_run_as('start')
+    mark_job_run_as_completed = _make_mark_job_run_as('complete')
+    mark_job_run_as_failed = _make_mark_job_run_as('fail')
+    mark_job_run_as_aborted = _make_mark_job_run_as('abort')
 
     def list_tags(self, limit=None, offset=None):
         return self._get(
-            self._url('/tags'),
-            params={
-                'limit': limit,
-                'offset': offset
-            }
+            self._url(_PATH_TAGS) + self._qs(limit=limit, offset=offset)
         )
 
-    def __mark_job_run_as(self, run_id, action):
-        MarquezClient._is_valid_uuid(run_id, 'run_id')
-
-        return self._post(
-            self._url('/jobs/runs/{0}/{1}', run_id, action), payload={}
-        )
+    # Batch API
+    def flush(self):
+        """Sends all enqueued requests and returns their responses.
+
+        The Marquez API has no bulk endpoint, so the queue is drained as
+        a pipelined sequence over the pooled keep-alive session; the
+        saving is in connection reuse, not request count.
+        """
+        pending, self._pending = self._pending, []
+
+        responses = []
+        for method, url, payload in pending:
+            if method == 'PUT':
+                responses.append(self._put(url, payload=payload))
+            else:
+                responses.append(self._post(url, payload=payload))
+
+        return responses
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Flushes enqueued requests on exit:
+
+            with client.batch():
+                client.enqueue_dataset(...)
+                client.enqueue_job(...)
+        """
+        try:
+            yield self
+        finally:
+            self.flush()
 
     # Common
     def _url(self, path, *args):
-        encoded_args = [quote(arg.encode('utf-8'), safe='') for arg in args]
-        return f'{self._api_base}{path.format(*encoded_args)}'
+        return _build_url(self._api_base, path, args)
 
-    def _post(self, url, payload, as_json=True):
-        now_ms = self._now_ms()
+    @staticmethod
+    def _qs(**kwargs):
+        pairs = [(k, v) for k, v in kwargs.items() if v is not None]
+        return f'?{urlencode(pairs)}' if pairs else ''
 
-        response = requests.post(
-            url=url, headers=_HEADERS, json=payload, timeout=self._timeout)
-        log.info(f'{url}', method='POST', payload=json.dumps(
-            payload), duration_ms=(self._now_ms() - now_ms))
+    def _post(self, url, payload, as_json=True):
+        if self._pool is not None:
+            return self._pool_request('POST', url, payload, as_json)
+
+        t0 = time.monotonic_ns()
+
+        body, compressed = self._prepare_body(payload)
+        response = self._session.post(
+            url=url, data=body,
+            headers=_CONTENT_TYPE_JSON_GZIP if compressed
+            else _CONTENT_TYPE_JSON,
+            timeout=self._timeout)
+        if log.is_enabled_for(logging.INFO):
+            log.info(url, method='POST',
+                     payload=json.dumps(payload, default=str),
+                     duration_ms=(time.monotonic_ns() - t0) // 1_000_000)
 
         return self._response(response, as_json)
 
     def _put(self, url, payload=None, as_json=True):
-        now_ms = self._now_ms()
-
-        response = requests.put(
-            url=url, headers=_HEADERS, json=payload, timeout=self._timeout)
-        log.info(f'{url}', method='PUT', payload=json.dumps(
-            payload), duration_ms=(self._now_ms() - now_ms))
+        if self._pool is not None:
+            return self._pool_request('PUT', url, payload, as_json)
+
+        t0 = time.monotonic_ns()
+
+        body, compressed = self._prepare_body(payload)
+        response = self._session.put(
+            url=url, data=body,
+            headers=_CONTENT_TYPE_JSON_GZIP if compressed
+            else _CONTENT_TYPE_JSON,
+            timeout=self._timeout)
+        if log.is_enabled_for(logging.INFO):
+            log.info(url, method='PUT',
+                     payload=json.dumps(payload, default=str),
+                     duration_ms=(time.monotonic_ns() - t0) // 1_000_000)
 
         return self._response(response, as_json)
 
-    def _get(self, url, params=None, as_json=True):
-        now_ms = self._now_ms()
+    def _get(self, url, as_json=True):
+        if self._pool is not None:
+            return self._pool_request('GET', url, None, as_json)
+
+        t0 = time.monotonic_ns()
 
-        response = requests.get(
-            url, params=params, headers=_HEADERS, timeout=self._timeout)
-        log.info(f'{url}', method='GET',
-                 duration_ms=(self._now_ms() - now_ms))
+        response = self._session.get(url, timeout=self._timeout)
+        if log.is_enabled_for(logging.INFO):
+            log.info(url, method='GET',
+                     duration_ms=(time.monotonic_ns() - t0) // 1_000_000)
 
         return self._response(response, as_json)
 
-    @staticmethod
-    def _now_ms():
-        return int(round(time.time() * 1000))
+    def _pool_request(self, method, url, payload, as_json):
+        t0 = time.monotonic_ns()
 
-    def _response(self, response, as_json):
-        try:
-            response.raise_for_status()
-        except requests.exceptions.HTTPError as e:
-            self._raise_api_error(e)
+        if payload is None:
+            body, headers = None, None
+        else:
+            body, compressed = self._prepare_body(payload)
+            headers = _JSON_HEADERS_GZIP if compressed else _JSON_HEADERS
+        response = self._pool.request(method, url, body=body,
+                                      headers=headers)
+        if log.is_enabled_for(logging.INFO):
+            log.info(url, method=method,
+                     duration_ms=(time.monotonic_ns() - t0) // 1_000_000)
 
-        return response.json() if as_json else response.text
+        if response.status >= 400:
+            raise errors.APIError()
 
-    def _raise_api_error(self, e):
-        # TODO: https://github.com/MarquezProject/marquez-python/issues/55
-        raise errors.APIError() from e
+        if as_json:
+            return _json_loads(response.data)
 
-    @staticmethod
-    def _to_seconds(timeout_ms):
-        return float(timeout_ms) / 1000.0
+        return response.data.decode('utf-8')
 
-    @staticmethod
-    def _is_none(variable_value, variable_name):
-        if not variable_value:
-            raise ValueError(f"{variable_name} must not be None")
+    def _prepare_body(self, payload):
+        body = _json_dumps(payload)
 
-    @staticmethod
-    def _check_name_length(variable_value, variable_name):
-        MarquezClient._is_none(variable_value, variable_name)
-
-        # ['namespace_name', 'owner_name', 'source_name'] <= 64
-        # ['dataset_name', 'field_name', 'job_name', 'tag_name'] <= 255
-        if variable_name in ['namespace_name', 'owner_name', 'source_name']:
-            if len(variable_value) > 64:
-                raise ValueError(f"{variable_name} length is"
-                                 f" {len(variable_value)}, must be <= 64")
-        else:
-            if len(variable_value) > 255:
-                raise ValueError(f"{variable_name} length is"
-                                 f" {len(variable_value)}, must be <= 255")
+        if self._compress and len(body) > _COMPRESS_MIN_BYTES:
+            return gzip.compress(body, compresslevel=1), True
 
-    @staticmethod
-    def _is_valid_uuid(variable_value, variable_name):
-        MarquezClient._is_none(variable_value, variable_name)
+        return body, False
+
+    def _response(self, response, as_json):
+        import requests
 
         try:
-            uuid.UUID(str(variable_value))
-        except ValueError:
-            raise ValueError(f"{variable_name} must be a valid UUID")
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            self._raise_api_error(e)
 
-    @staticmethod
-    def _is_instance_of(variable_value, variable_enum_type):
-        if not isinstance(variable_value, variable_enum_type):
-            raise ValueError(f"{variable_value} must be an instance"
-                             f" of {variable_enum_type}")
+        return _json_loads(response.content) if as_json else response.text
 
-    @staticmethod
-    def _is_valid_connection_url(connection_url):
-        MarquezClient._is_none(connection_url, 'connection_url')
+    def _raise_api_error(self, e):
+        # TODO: https://github.com/MarquezProject/marquez-python/issues/55
+        raise errors.APIError() from e
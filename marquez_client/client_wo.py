@@ -0,0 +1,265 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import functools
+
+from .models import DatasetType, SourceType, JobType
+from marquez_client._validators import (
+    _check_name_length, _is_instance_of, _is_none,
+    _is_valid_connection_url, _is_valid_uuid
+)
+from marquez_client.client import (
+    _API_PATH, _HEADERS, _USER_AGENT,
+    _PATH_NAMESPACE, _PATH_SOURCE, _PATH_DATASET, _PATH_JOB,
+    _PATH_JOB_RUNS, _RUN_TRANSITION_PATHS, _quote_arg,
+    _SOURCE_TYPE_VALUES, _DATASET_TYPE_VALUES, _JOB_TYPE_NAMES
+)
+
+_PATH_LINEAGE = '/lineage'
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_path(path, args):
+    return f'/{_API_PATH}{path % tuple(_quote_arg(arg) for arg in args)}'
+
+
+# Marquez Write Only Client
+class MarquezWriteOnlyClient(object):
+    """Fire-and-forget client covering the write surface of the Marquez
+    API, emitting through a pluggable Backend (HTTP, log, ...). Run ids
+    are supplied by the caller so emission never depends on a server
+    response.
+    """
+
+    def __init__(self, backend):
+        self._backend = backend
+
+    def close(self):
+        self._backend.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # Namespace API
+    def create_namespace(self, namespace_name, owner_name, description=None):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(owner_name, 'owner_name')
+
+        payload = {
+            'ownerName': owner_name,
+            **({'description': description} if description else {})
+        }
+
+        return self._backend.put(
+            self._url(_PATH_NAMESPACE, namespace_name),
+            headers=_HEADERS,
+            payload=payload
+        )
+
+    # Source API
+    def create_source(self, source_name, source_type, connection_url,
+                      description=None):
+        _check_name_length(source_name, 'source_name')
+        _is_instance_of(source_type, SourceType)
+        _is_valid_connection_url(connection_url)
+
+        payload = {
+            'type': _SOURCE_TYPE_VALUES[source_type],
+            'connectionUrl': connection_url,
+            **({'description': description} if description else {})
+        }
+
+        return self._backend.put(
+            self._url(_PATH_SOURCE, source_name),
+            headers=_HEADERS,
+            payload=payload
+        )
+
+    # Datasets API
+    def create_dataset(self, namespace_name, dataset_name, dataset_type,
+                       physical_name, source_name,
+                       description=None, run_id=None,
+                       schema_location=None,
+                       fields=None, tags=None):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(dataset_name, 'dataset_name')
+        _is_instance_of(dataset_type, DatasetType)
+
+        if dataset_type == DatasetType.STREAM:
+            _is_none(schema_location, 'schema_location')
+
+        _check_name_length(physical_name, 'physical_name')
+        _check_name_length(source_name, 'source_name')
+
+        optional = (
+            ('description', description),
+            ('runId', run_id),
+            ('fields', fields),
+            ('tags', tags),
+            ('schemaLocation', schema_location)
+        )
+
+        payload = {
+            'type': _DATASET_TYPE_VALUES[dataset_type],
+            'physicalName': physical_name,
+            'sourceName': source_name,
+            **{k: v for k, v in optional if v}
+        }
+
+        return self._backend.put(
+            self._url(_PATH_DATASET, namespace_name,
+                      dataset_name),
+            headers=_HEADERS,
+            payload=payload
+        )
+
+    # Job API
+    def create_job(self, namespace_name, job_name, job_type, location=None,
+                   input_dataset=None, output_dataset=None,
+                   description=None, context=None):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(job_name, 'job_name')
+        _is_instance_of(job_type, JobType)
+
+        optional = (
+            ('context', context),
+            ('location', location),
+            ('description', description)
+        )
+
+        payload = {
+            'inputs': input_dataset or [],
+            'outputs': output_dataset or [],
+            'type': _JOB_TYPE_NAMES[job_type],
+            **{k: v for k, v in optional if v}
+        }
+
+        return self._backend.put(
+            self._url(_PATH_JOB, namespace_name, job_name),
+            headers=_HEADERS,
+            payload=payload
+        )
+
+    def create_job_run(self, namespace_name, job_name, run_id,
+                       nominal_start_time=None, nominal_end_time=None,
+                       run_args=None, mark_as_running=False):
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(job_name, 'job_name')
+        _is_valid_uuid(run_id, 'run_id')
+
+        optional = (
+            ('nominalStartTime', nominal_start_time),
+            ('nominalEndTime', nominal_end_time),
+            ('runArgs', run_args)
+        )
+
+        payload = {
+            'id': run_id,
+            **{k: v for k, v in optional if v}
+        }
+
+        response = self._backend.post(
+            self._url(_PATH_JOB_RUNS,
+                      namespace_name, job_name),
+            headers=_HEADERS,
+            payload=payload
+        )
+
+        if mark_as_running:
+            response = self.mark_job_run_as_started(run_id)
+
+        return response
+
+    # Lineage API
+    def emit_lineage(self, run_id, event_type, job, inputs=None,
+                     outputs=None, event_time=None, producer=None):
+        """Posts one OpenLineage-style event to /lineage. The server
+        infers namespace/job/dataset metadata from the event, so a run
+        transition costs a single request instead of a sequence of
+        entity PUTs followed by a state POST.
+
+        job is the {'namespace': ..., 'name': ...} pair of the emitting
+        job; event_type is one of 'START', 'COMPLETE', 'FAIL', 'ABORT'.
+        """
+        _is_valid_uuid(run_id, 'run_id')
+        _is_none(event_type, 'event_type')
+        _is_none(job, 'job')
+
+        event = {
+            'eventType': event_type,
+            'eventTime': event_time or datetime.datetime.now(
+                datetime.timezone.utc).isoformat(),
+            'run': {'runId': run_id},
+            'job': job,
+            'inputs': inputs or [],
+            'outputs': outputs or [],
+            'producer': producer or _USER_AGENT
+        }
+
+        return self._backend.post(
+            self._url(_PATH_LINEAGE),
+            headers=_HEADERS,
+            payload=event
+        )
+
+    def submit_run(self, namespace_name, job_name, run_id, final_state,
+                   start_time=None, end_time=None, inputs=None,
+                   outputs=None):
+        """Submits a whole run lifecycle in two lineage events: a START
+        at start_time and the terminal state at end_time. For a run
+        whose outcome is already known this replaces the create_job_run
+        POST plus per-transition POSTs, cutting the round-trips for a
+        completed run from three to two.
+
+        final_state is one of 'COMPLETE', 'FAIL', 'ABORT'. There is no
+        server-side batch endpoint for run transitions, so the two
+        events are emitted back to back; mark_job_run_as_* remain for
+        callers driving transitions as they happen.
+        """
+        _check_name_length(namespace_name, 'namespace_name')
+        _check_name_length(job_name, 'job_name')
+
+        job = {'namespace': namespace_name, 'name': job_name}
+
+        self.emit_lineage(run_id, 'START', job, inputs=inputs,
+                          event_time=start_time)
+
+        return self.emit_lineage(run_id, final_state, job, inputs=inputs,
+                                 outputs=outputs, event_time=end_time)
+
+    def mark_job_run_as_started(self, run_id):
+        return self.__mark_job_run_as(run_id, 'start')
+
+    def mark_job_run_as_completed(self, run_id):
+        return self.__mark_job_run_as(run_id, 'complete')
+
+    def mark_job_run_as_failed(self, run_id):
+        return self.__mark_job_run_as(run_id, 'fail')
+
+    def mark_job_run_as_aborted(self, run_id):
+        return self.__mark_job_run_as(run_id, 'abort')
+
+    def __mark_job_run_as(self, run_id, action):
+        _is_valid_uuid(run_id, 'run_id')
+
+        return self._backend.post(
+            self._url(_RUN_TRANSITION_PATHS[action], run_id),
+            headers=_HEADERS
+        )
+
+    # Common
+    def _url(self, path, *args):
+        return _build_path(path, args)
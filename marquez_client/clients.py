@@ -0,0 +1,44 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+
+from marquez_client.client_wo import MarquezWriteOnlyClient
+from marquez_client.http_backend import HttpBackend
+from marquez_client.log_backend import LogBackend
+
+_DEFAULT_URL = 'http://localhost:8080'
+
+
+class Clients(object):
+    @staticmethod
+    def new_write_only_client(backend=None):
+        if backend is None:
+            backend = Clients._backend_from_env()
+
+        return MarquezWriteOnlyClient(backend)
+
+    @staticmethod
+    def _backend_from_env():
+        backend = os.environ.get('MARQUEZ_BACKEND', 'http').lower()
+
+        if backend == 'log':
+            return LogBackend()
+
+        url = os.environ.get('MARQUEZ_URL', _DEFAULT_URL)
+
+        if backend == 'http2':
+            # Imported lazily; needs the optional 'http2' extra (httpx).
+            from marquez_client.http2_backend import Http2Backend
+            return Http2Backend(url)
+
+        return HttpBackend(url)
@@ -0,0 +1,124 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from marquez_client import errors
+from marquez_client import log
+from marquez_client.backend import Backend
+from marquez_client.client import (
+    _CONTENT_TYPE_JSON, _DEFAULT_TIMEOUT_S, _HEADERS,
+    _json_dumps, _json_loads
+)
+
+
+class Http2Backend(Backend):
+    """Emits metadata over HTTP/2 via a long-lived httpx.Client.
+
+    HTTP/2 multiplexes concurrent requests onto one TCP connection, so
+    many emissions to the same Marquez host share a single socket and
+    TLS handshake instead of competing for pooled HTTP/1.1 connections.
+
+    httpx is an optional dependency; install the 'http2' extra
+    (pip install marquez-python[http2]) to use this backend.
+    """
+
+    def __init__(self, url, timeout_ms=None):
+        import httpx
+
+        self._url = url
+        self._timeout = (float(timeout_ms) / 1000.0 if timeout_ms
+                         else _DEFAULT_TIMEOUT_S)
+
+        self._client = httpx.Client(
+            base_url=url,
+            http2=True,
+            headers={**_HEADERS, **_CONTENT_TYPE_JSON},
+            timeout=self._timeout,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50
+            )
+        )
+
+        log.debug(self._url)
+
+    def put(self, path, headers, payload):
+        response = self._client.put(
+            path,
+            headers=None if headers is _HEADERS else headers,
+            content=_json_dumps(payload))
+
+        return self._response(response)
+
+    def post(self, path, headers, payload=None):
+        response = self._client.post(
+            path,
+            headers=None if headers is _HEADERS else headers,
+            content=_json_dumps(payload) if payload is not None else None)
+
+        return self._response(response)
+
+    def close(self):
+        self._client.close()
+
+    @staticmethod
+    def _response(response):
+        import httpx
+
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise errors.APIError() from e
+
+        return _json_loads(response.content)
+
+
+class AsyncHttp2Backend(Backend):
+    """Async variant of Http2Backend, backed by httpx.AsyncClient."""
+
+    def __init__(self, url, timeout_ms=None):
+        import httpx
+
+        self._url = url
+        self._timeout = (float(timeout_ms) / 1000.0 if timeout_ms
+                         else _DEFAULT_TIMEOUT_S)
+
+        self._client = httpx.AsyncClient(
+            base_url=url,
+            http2=True,
+            headers={**_HEADERS, **_CONTENT_TYPE_JSON},
+            timeout=self._timeout,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50
+            )
+        )
+
+        log.debug(self._url)
+
+    async def put(self, path, headers, payload):
+        response = await self._client.put(
+            path,
+            headers=None if headers is _HEADERS else headers,
+            content=_json_dumps(payload))
+
+        return Http2Backend._response(response)
+
+    async def post(self, path, headers, payload=None):
+        response = await self._client.post(
+            path,
+            headers=None if headers is _HEADERS else headers,
+            content=_json_dumps(payload) if payload is not None else None)
+
+        return Http2Backend._response(response)
+
+    async def close(self):
+        await self._client.aclose()
@@ -0,0 +1,108 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import socket
+
+import requests
+import urllib3
+
+from marquez_client import errors
+from marquez_client import log
+from marquez_client.backend import Backend
+from marquez_client.client import (
+    _CONTENT_TYPE_JSON, _DEFAULT_TIMEOUT_S, _HEADERS,
+    _json_dumps, _json_loads
+)
+
+
+# TCP keepalive probes detect half-dead connections before a request
+# is written to one, avoiding mid-run reconnect stalls on long-idle
+# pooled sockets. The TCP_KEEP* knobs are Linux-specific, so each is
+# added only where the platform exposes it.
+_KEEPALIVE_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+for _opt, _value in (('TCP_KEEPIDLE', 30), ('TCP_KEEPINTVL', 10),
+                     ('TCP_KEEPCNT', 3)):
+    if hasattr(socket, _opt):
+        _KEEPALIVE_OPTIONS.append(
+            (socket.IPPROTO_TCP, getattr(socket, _opt), _value))
+
+
+class _KeepAliveAdapter(requests.adapters.HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = (
+            urllib3.connection.HTTPConnection.default_socket_options
+            + _KEEPALIVE_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+class HttpBackend(Backend):
+    """Emits metadata to a Marquez HTTP endpoint.
+
+    One requests.Session, mounted with a pooled HTTPAdapter, is shared
+    across calls so sequential emissions reuse a keep-alive connection
+    instead of paying TCP+TLS setup per request.
+    """
+
+    def __init__(self, url, timeout_ms=None):
+        self._url = url
+        self._timeout = (float(timeout_ms) / 1000.0 if timeout_ms
+                         else _DEFAULT_TIMEOUT_S)
+
+        self._session = requests.Session()
+        # The standard headers live on the session, so the common case
+        # skips the per-request header merge entirely.
+        self._session.headers.update({**_HEADERS, **_CONTENT_TYPE_JSON})
+        adapter = _KeepAliveAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=urllib3.util.Retry(
+                total=3,
+                backoff_factor=0.1,
+                status_forcelist=[502, 503, 504]
+            )
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+
+        log.debug(self._url)
+
+    def put(self, path, headers, payload):
+        # Serialize up front with _json_dumps (orjson when available)
+        # instead of letting requests fall back to stdlib json.
+        response = self._session.put(
+            url=f'{self._url}{path}',
+            headers=None if headers is _HEADERS else headers,
+            data=_json_dumps(payload),
+            timeout=self._timeout)
+
+        return self._response(response)
+
+    def post(self, path, headers, payload=None):
+        response = self._session.post(
+            url=f'{self._url}{path}',
+            headers=None if headers is _HEADERS else headers,
+            data=_json_dumps(payload) if payload is not None else None,
+            timeout=self._timeout)
+
+        return self._response(response)
+
+    def close(self):
+        self._session.close()
+
+    @staticmethod
+    def _response(response):
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            raise errors.APIError() from e
+
+        return _json_loads(response.content)
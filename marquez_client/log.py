@@ -40,6 +40,10 @@ _LOG.setLevel(_log_level())
 _LOG.addHandler(_CONSOLE)
 
 
+def is_enabled_for(level):
+    return _LOG.isEnabledFor(level)
+
+
 def debug(msg, **extra):
     _LOG.debug(_fmt(msg, **extra))
 
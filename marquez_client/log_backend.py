@@ -0,0 +1,37 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+
+from marquez_client import log
+from marquez_client.backend import Backend
+
+
+class LogBackend(Backend):
+    """Logs metadata instead of emitting it; useful for dry runs and
+    tests where no Marquez server is available.
+
+    Each call is a no-op unless INFO is enabled, so a silenced
+    LogBackend costs one level check per emission instead of a dict
+    build and stringify.
+    """
+
+    def put(self, path, headers, payload):
+        if log.is_enabled_for(logging.INFO):
+            log.info(path, method='PUT', payload=payload)
+
+    def post(self, path, headers, payload=None):
+        if log.is_enabled_for(logging.INFO):
+            log.info(path, method='POST', payload=payload)
+
+    def close(self):
+        pass
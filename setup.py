@@ -57,9 +57,13 @@ setup(
     keywords=["Marquez"],
     packages=find_packages(),
     install_requires=[
-        "requests",
-        "six"
+        "requests"
     ],
+    extras_require={
+        "async": ["aiohttp"],
+        "http2": ["httpx[http2]"],
+        "orjson": ["orjson"]
+    },
     include_package_data=True,
     long_description="""\
     Marquez-Python is an open source library for building clients that
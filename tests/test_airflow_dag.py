@@ -0,0 +1,106 @@
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from marquez_client.async_client_wo import AsyncMarquezWriteOnlyClient
+from marquez_client.clients import Clients
+from marquez_client.log_backend import LogBackend
+from marquez_client.models import DatasetType, SourceType, JobType
+import mock
+import uuid
+
+_NAMESPACE = "my-namespace"
+_OWNER = "me"
+_SOURCE = "my-source"
+_SOURCE_URL = "jdbc:postgresql://localhost:5432/test"
+_DATASET = "my-dataset"
+_JOB = "my-job"
+
+
+class TestAirflowDAG(unittest.TestCase):
+    def setUp(self):
+        self.client = Clients.new_write_only_client(LogBackend())
+
+    def tearDown(self):
+        # releases the backend's pooled connections between test methods
+        self.client.close()
+
+    def test_create_dag(self):
+        # namespace/source are constant and idempotent; register once
+        # instead of per iteration
+        self.client.create_namespace(_NAMESPACE, _OWNER)
+        self.client.create_source(_SOURCE, SourceType.POSTGRESQL, _SOURCE_URL)
+
+        # dataset/job registration is independent across iterations, so
+        # the PUTs can overlap instead of running back to back
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = []
+            for i in range(3):
+                futures.append(executor.submit(
+                    self.client.create_dataset,
+                    namespace_name=_NAMESPACE,
+                    dataset_name=f'{_DATASET}-{i}',
+                    dataset_type=DatasetType.DB_TABLE,
+                    physical_name=f'public.mytable_{i}',
+                    source_name=_SOURCE
+                ))
+                futures.append(executor.submit(
+                    self.client.create_job,
+                    namespace_name=_NAMESPACE,
+                    job_name=_JOB,
+                    job_type=JobType.BATCH,
+                    input_dataset=[{
+                        'namespace': _NAMESPACE,
+                        'name': f'{_DATASET}-{i}'
+                    }]
+                ))
+            for future in futures:
+                future.result()
+
+        for i in range(3):
+            # the run outcome is known up front, so the whole lifecycle
+            # is two lineage events instead of a run POST plus
+            # per-state transition POSTs
+            self.client.submit_run(
+                _NAMESPACE, _JOB, str(uuid.uuid4()),
+                'COMPLETE' if i % 2 == 0 else 'FAIL',
+                inputs=[{
+                    'namespace': _NAMESPACE,
+                    'name': f'{_DATASET}-{i}'
+                }]
+            )
+
+
+class TestAsyncAirflowDAG(unittest.IsolatedAsyncioTestCase):
+    async def test_create_dag_concurrent(self):
+        backend = mock.AsyncMock()
+        client = AsyncMarquezWriteOnlyClient(backend)
+
+        # namespace/source registration is independent, so both calls
+        # can be in flight at once
+        await asyncio.gather(
+            client.create_namespace(_NAMESPACE, _OWNER),
+            client.create_source(_SOURCE, SourceType.POSTGRESQL, _SOURCE_URL)
+        )
+
+        assert backend.put.await_count == 2
+
+        run_id = str(uuid.uuid4())
+        await client.create_job_run(
+            _NAMESPACE, _JOB, run_id, mark_as_running=True)
+
+        assert backend.post.await_count == 2
+
+    async def test_submit_run_awaits_both_events(self):
+        backend = mock.AsyncMock()
+        client = AsyncMarquezWriteOnlyClient(backend)
+
+        await client.submit_run(
+            _NAMESPACE, _JOB, str(uuid.uuid4()), 'COMPLETE')
+
+        # both the START and the terminal lineage event must be awaited
+        assert backend.post.await_count == 2
+
+
+if __name__ == '__main__':
+    unittest.main()
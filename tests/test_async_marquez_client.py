@@ -0,0 +1,68 @@
+import unittest
+
+from marquez_client.async_client import AsyncMarquezClient
+from marquez_client.models import RunState
+import mock
+import uuid
+
+_NAMESPACE = "my-namespace"
+
+
+class TestAsyncMarquezClient(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = AsyncMarquezClient()
+
+    @mock.patch("marquez_client.async_client.AsyncMarquezClient._put")
+    async def test_create_namespace(self, mock_put):
+        owner_name = "me"
+        description = "my namespace for testing."
+
+        mock_put.return_value = {
+            "name": _NAMESPACE,
+            "ownerName": owner_name,
+            "description": description
+        }
+
+        response = await self.client.create_namespace(
+            _NAMESPACE, owner_name, description)
+
+        assert _NAMESPACE == str(response['name'])
+        assert owner_name == str(response['ownerName'])
+        assert description == str(response['description'])
+
+    @mock.patch("marquez_client.async_client.AsyncMarquezClient._get")
+    async def test_list_job_runs(self, mock_get):
+        job_name = "my-job"
+        run_id = str(uuid.uuid4())
+
+        mock_get.return_value = {
+            'runs': [{
+                'id': f'{run_id}',
+                'state': 'RUNNING'
+            }]
+        }
+
+        response = await self.client.list_job_runs(
+            _NAMESPACE, job_name, limit=10)
+
+        assert str(response['runs'][0]['id']) == run_id
+        url = mock_get.call_args[0][0]
+        assert url.endswith(f'/namespaces/{_NAMESPACE}/jobs/{job_name}/runs')
+
+    @mock.patch("marquez_client.async_client.AsyncMarquezClient._post")
+    async def test_mark_job_run_as_start(self, mock_post):
+        run_id = str(uuid.uuid4())
+
+        mock_post.return_value = {
+            'id': f'{run_id}',
+            'state': 'RUNNING'
+        }
+
+        response = await self.client.mark_job_run_as_started(run_id=run_id)
+
+        assert str(response['id']) == run_id
+        assert str(response['state']) == RunState.RUNNING.value
+
+
+if __name__ == '__main__':
+    unittest.main()
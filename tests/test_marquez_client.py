@@ -242,6 +242,27 @@ class TestMarquezClient(unittest.TestCase):
         assert str(response['run_args']) == str(run_args)
         assert str(response['createdAt']) == created_at
 
+    @mock.patch("marquez_client.MarquezClient._put")
+    def test_batch_enqueue_and_flush(self, mock_put):
+        mock_put.return_value = {'name': 'my-job'}
+
+        with self.client.batch():
+            self.client.enqueue_job(
+                namespace_name=_NAMESPACE,
+                job_name="my-job",
+                job_type=JobType.BATCH
+            )
+            self.client.enqueue_dataset(
+                namespace_name=_NAMESPACE,
+                dataset_name="my-dataset",
+                dataset_type=DatasetType.DB_TABLE,
+                physical_name="public.mytable",
+                source_name="my-source"
+            )
+
+        assert mock_put.call_count == 2
+        assert not self.client._pending
+
     @mock.patch("marquez_client.MarquezClient._post")
     def test_mark_job_run_as_start(self, mock_post):
         run_id = str(uuid.uuid4())
@@ -264,6 +285,22 @@ class TestMarquezClient(unittest.TestCase):
         assert str(response['id']) == run_id
         assert str(response['state']) == RunState.RUNNING.value
 
+    @mock.patch("marquez_client.MarquezClient._post")
+    def test_mark_job_run_as_start_with_uuid(self, mock_post):
+        # run ids may be passed as uuid.UUID, not just str
+        run_id = uuid.uuid4()
+
+        mock_post.return_value = {
+            'id': f'{run_id}',
+            'state': 'RUNNING'
+        }
+
+        response = self.client.mark_job_run_as_started(run_id=run_id)
+
+        assert str(response['id']) == str(run_id)
+        url = mock_post.call_args[0][0]
+        assert url.endswith(f'/jobs/runs/{run_id}/start')
+
     @mock.patch("marquez_client.MarquezClient._post")
     def test_mark_job_run_as_completed(self, mock_post):
         run_id = str(uuid.uuid4())